@@ -1,6 +1,4 @@
-import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 
 class Process:
     def __init__(self, pid: int, arrival: int, burst: int, priority: int = 0):
@@ -70,17 +68,21 @@ def sjf_scheduling(processes: List[Process], preemptive: bool = False) -> Tuple[
             if current_process.start_time == -1:
                 current_process.start_time = current_time
                 current_process.response_time = current_time - current_process.arrival
+            segment_start = current_time
             switches += 1
         
         # If preemptive and a shorter process arrives
         if preemptive and current_process and ready_queue:
             shortest = min(ready_queue, key=lambda x: x.remaining_burst)
             if shortest.remaining_burst < current_process.remaining_burst:
-                gantt_data.append((current_process.pid, current_process.start_time, current_time))
+                gantt_data.append((current_process.pid, segment_start, current_time))
                 ready_queue.append(current_process)
                 current_process = shortest
                 ready_queue.remove(shortest)
-                current_process.start_time = current_time
+                if current_process.start_time == -1:
+                    current_process.start_time = current_time
+                    current_process.response_time = current_time - current_process.arrival
+                segment_start = current_time
                 switches += 1
         
         # If no process is running and no process will arrive
@@ -92,7 +94,7 @@ def sjf_scheduling(processes: List[Process], preemptive: bool = False) -> Tuple[
             current_process.remaining_burst -= 1
             if current_process.remaining_burst == 0:
                 current_process.completion_time = current_time + 1
-                gantt_data.append((current_process.pid, current_process.start_time, current_process.completion_time))
+                gantt_data.append((current_process.pid, segment_start, current_process.completion_time))
                 current_process = None
         
         current_time += 1
@@ -115,24 +117,22 @@ def round_robin_scheduling(processes: List[Process], time_quantum: int) -> Tuple
                 if p not in ready_queue and p != current_process:
                     ready_queue.append(p)
         
+        # If time quantum expires, close the slice and requeue behind new arrivals
+        if current_process and time_slice == 0:
+            gantt_data.append((current_process.pid, segment_start, current_time))
+            ready_queue.append(current_process)
+            current_process = None
+        
         # If no process is running and ready queue is not empty
         if not current_process and ready_queue:
             current_process = ready_queue.pop(0)
             if current_process.start_time == -1:
                 current_process.start_time = current_time
                 current_process.response_time = current_time - current_process.arrival
+            segment_start = current_time
             time_slice = time_quantum
             switches += 1
         
-        # If time quantum expires
-        if current_process and time_slice == 0:
-            if current_process.remaining_burst > 0:
-                ready_queue.append(current_process)
-            else:
-                current_process.completion_time = current_time
-                gantt_data.append((current_process.pid, current_process.start_time, current_process.completion_time))
-            current_process = None
-        
         # If no process is running and no process will arrive
         if not current_process and not ready_queue and current_time >= max(p.arrival for p in processes):
             break
@@ -143,7 +143,7 @@ def round_robin_scheduling(processes: List[Process], time_quantum: int) -> Tuple
             time_slice -= 1
             if current_process.remaining_burst == 0:
                 current_process.completion_time = current_time + 1
-                gantt_data.append((current_process.pid, current_process.start_time, current_process.completion_time))
+                gantt_data.append((current_process.pid, segment_start, current_process.completion_time))
                 current_process = None
         
         current_time += 1
@@ -173,6 +173,7 @@ def priority_scheduling(processes: List[Process], ascending: bool = True) -> Tup
             if current_process.start_time == -1:
                 current_process.start_time = current_time
                 current_process.response_time = current_time - current_process.arrival
+            segment_start = current_time
             switches += 1
         
         # If a higher priority process arrives
@@ -180,11 +181,14 @@ def priority_scheduling(processes: List[Process], ascending: bool = True) -> Tup
             highest_priority = min(ready_queue, key=lambda x: x.priority if ascending else -x.priority)
             if (ascending and highest_priority.priority < current_process.priority) or \
                (not ascending and highest_priority.priority > current_process.priority):
-                gantt_data.append((current_process.pid, current_process.start_time, current_time))
+                gantt_data.append((current_process.pid, segment_start, current_time))
                 ready_queue.append(current_process)
                 current_process = highest_priority
                 ready_queue.remove(highest_priority)
-                current_process.start_time = current_time
+                if current_process.start_time == -1:
+                    current_process.start_time = current_time
+                    current_process.response_time = current_time - current_process.arrival
+                segment_start = current_time
                 switches += 1
         
         # If no process is running and no process will arrive
@@ -196,7 +200,7 @@ def priority_scheduling(processes: List[Process], ascending: bool = True) -> Tup
             current_process.remaining_burst -= 1
             if current_process.remaining_burst == 0:
                 current_process.completion_time = current_time + 1
-                gantt_data.append((current_process.pid, current_process.start_time, current_process.completion_time))
+                gantt_data.append((current_process.pid, segment_start, current_process.completion_time))
                 current_process = None
         
         current_time += 1
@@ -0,0 +1,251 @@
+"""Differential fuzz tests for the scheduling engines.
+
+Every engine is run on randomly generated workloads and checked two ways:
+against invariants any valid schedule must satisfy, and tick-for-tick
+against a small reference simulator that states each policy directly.
+
+Environment knobs:
+    SCHED_FUZZ_RUNS     workloads generated per algorithm (default 200)
+    SCHED_FUZZ_SEED     base seed, printed in failure ids for replay (default 0)
+    SCHED_TIMED=1       also run the timed regression checks
+    SCHED_TIMED_FACTOR  max allowed engine/reference runtime ratio (default 10)
+"""
+import os
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from scheduling_algorithms import (
+    Process,
+    calculate_metrics,
+    fcfs_scheduling,
+    priority_scheduling,
+    round_robin_scheduling,
+    sjf_scheduling,
+)
+
+FUZZ_RUNS = int(os.environ.get("SCHED_FUZZ_RUNS", "200"))
+FUZZ_SEED = int(os.environ.get("SCHED_FUZZ_SEED", "0"))
+TIMED = os.environ.get("SCHED_TIMED") == "1"
+TIMED_FACTOR = float(os.environ.get("SCHED_TIMED_FACTOR", "10"))
+
+# (pid, arrival, burst, priority)
+Workload = List[Tuple[int, int, int, int]]
+
+
+def random_workload(rng: random.Random, max_processes: int = 8) -> Workload:
+    """Generate a workload mixing clustered arrivals, idle gaps and ties."""
+    n = rng.randint(1, max_processes)
+    shape = rng.choice(["clustered", "spread", "late"])
+    workload = []
+    for pid in range(1, n + 1):
+        if shape == "clustered":
+            arrival = rng.randint(0, 2)
+        elif shape == "spread":
+            arrival = rng.randint(0, 4 * n)
+        else:
+            # Nothing at t=0 and long gaps between bursts of arrivals
+            arrival = rng.choice([3, 4, 20, 21, 40])
+        workload.append((pid, arrival, rng.randint(1, 6), rng.randint(0, 3)))
+    return workload
+
+
+def build_processes(workload: Workload) -> List[Process]:
+    return [Process(pid, arrival, burst, priority) for pid, arrival, burst, priority in workload]
+
+
+# --- Reference simulator ---------------------------------------------------
+
+def reference_timeline(workload: Workload, key: Callable[[int, int], int],
+                       preemptive: bool, quantum: Optional[int] = None) -> List[Optional[int]]:
+    """Return the pid running in each tick (None when idle).
+
+    ``key(index, remaining)`` orders ready processes; ties go to whichever
+    entered the ready queue first, with new arrivals queued ahead of a
+    process that was preempted or whose quantum expired in the same tick.
+    """
+    order = sorted(range(len(workload)), key=lambda i: workload[i][1])
+    remaining = [burst for _, _, burst, _ in workload]
+    queued: Dict[int, Tuple[int, int, int]] = {}
+    running: Optional[int] = None
+    slice_left = 0
+    timeline: List[Optional[int]] = []
+    t = 0
+
+    def best() -> int:
+        return min(queued, key=lambda i: (key(i, remaining[i]), queued[i]))
+
+    while any(remaining):
+        for rank, i in enumerate(order):
+            if workload[i][1] == t:
+                queued[i] = (t, 0, rank)
+        if running is not None and quantum is not None and slice_left == 0:
+            queued[running] = (t, 1, 0)
+            running = None
+        if running is not None and preemptive and queued:
+            candidate = best()
+            if key(candidate, remaining[candidate]) < key(running, remaining[running]):
+                queued[running] = (t, 1, 0)
+                running = None
+        if running is None and queued:
+            running = best()
+            del queued[running]
+            slice_left = quantum or 0
+
+        if running is None:
+            timeline.append(None)
+        else:
+            timeline.append(workload[running][0])
+            remaining[running] -= 1
+            slice_left -= 1
+            if remaining[running] == 0:
+                running = None
+        t += 1
+    return timeline
+
+
+def reference_fcfs(workload):
+    return reference_timeline(workload, lambda i, r: 0, preemptive=False)
+
+
+def reference_sjf(workload, preemptive):
+    return reference_timeline(workload, lambda i, r: r, preemptive=preemptive)
+
+
+def reference_round_robin(workload, quantum):
+    return reference_timeline(workload, lambda i, r: 0, preemptive=False, quantum=quantum)
+
+
+def reference_priority(workload, ascending):
+    sign = 1 if ascending else -1
+    return reference_timeline(workload, lambda i, r: sign * workload[i][3], preemptive=True)
+
+
+# name -> (engine, reference)
+ALGORITHMS = {
+    "fcfs": (fcfs_scheduling, reference_fcfs),
+    "sjf": (lambda ps: sjf_scheduling(ps, preemptive=False),
+            lambda w: reference_sjf(w, preemptive=False)),
+    "srtf": (lambda ps: sjf_scheduling(ps, preemptive=True),
+             lambda w: reference_sjf(w, preemptive=True)),
+    "rr1": (lambda ps: round_robin_scheduling(ps, 1),
+            lambda w: reference_round_robin(w, 1)),
+    "rr2": (lambda ps: round_robin_scheduling(ps, 2),
+            lambda w: reference_round_robin(w, 2)),
+    "rr4": (lambda ps: round_robin_scheduling(ps, 4),
+            lambda w: reference_round_robin(w, 4)),
+    "priority_asc": (lambda ps: priority_scheduling(ps, ascending=True),
+                     lambda w: reference_priority(w, ascending=True)),
+    "priority_desc": (lambda ps: priority_scheduling(ps, ascending=False),
+                      lambda w: reference_priority(w, ascending=False)),
+}
+
+
+# --- Invariants --------------------------------------------------------------
+
+def gantt_timeline(gantt_data: List[Tuple[int, int, int]]) -> List[Optional[int]]:
+    """Expand Gantt segments into a per-tick timeline, rejecting overlaps."""
+    end = max((seg_end for _, _, seg_end in gantt_data), default=0)
+    timeline: List[Optional[int]] = [None] * end
+    for pid, start, seg_end in gantt_data:
+        assert 0 <= start < seg_end, f"empty or inverted segment {(pid, start, seg_end)}"
+        for t in range(start, seg_end):
+            assert timeline[t] is None, f"P{pid} overlaps P{timeline[t]} at t={t}"
+            timeline[t] = pid
+    return timeline
+
+
+def check_schedule(workload: Workload, processes: List[Process],
+                   gantt_data: List[Tuple[int, int, int]]) -> List[Optional[int]]:
+    timeline = gantt_timeline(gantt_data)
+    by_pid = {p.pid: p for p in processes}
+    assert sorted(by_pid) == [pid for pid, _, _, _ in workload]
+
+    # Total busy time equals the sum of bursts, and each process gets exactly its burst
+    busy = [pid for pid in timeline if pid is not None]
+    assert len(busy) == sum(burst for _, _, burst, _ in workload)
+    for pid, arrival, burst, _ in workload:
+        ticks = [t for t, running in enumerate(timeline) if running == pid]
+        p = by_pid[pid]
+        assert len(ticks) == burst, f"P{pid} ran {len(ticks)} ticks, burst {burst}"
+        assert ticks[0] >= arrival, f"P{pid} ran before arriving"
+        assert p.start_time == ticks[0]
+        assert p.response_time == ticks[0] - arrival
+        assert p.completion_time == ticks[-1] + 1
+
+    # Work conservation: the CPU is only idle when nothing is ready
+    for t, running in enumerate(timeline):
+        if running is None:
+            ready = [p.pid for p in processes if p.arrival <= t < p.completion_time]
+            assert not ready, f"CPU idle at t={t} while {ready} were ready"
+
+    calculate_metrics(processes)
+    for p in processes:
+        assert p.turnaround_time >= p.burst
+        assert 0 <= p.response_time <= p.waiting_time
+    return timeline
+
+
+# --- Tests -------------------------------------------------------------------
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+@pytest.mark.parametrize("seed", range(FUZZ_SEED, FUZZ_SEED + FUZZ_RUNS))
+def test_matches_reference(name, seed):
+    engine, reference = ALGORITHMS[name]
+    workload = random_workload(random.Random(seed))
+    processes, gantt_data, _ = engine(build_processes(workload))
+    timeline = check_schedule(workload, processes, gantt_data)
+    assert timeline == reference(workload), f"workload={workload}"
+
+
+def test_idle_gap_before_late_arrival():
+    workload = [(1, 5, 2, 0), (2, 9, 1, 0)]
+    for name, (engine, _) in ALGORITHMS.items():
+        processes, gantt_data, _ = engine(build_processes(workload))
+        timeline = check_schedule(workload, processes, gantt_data)
+        assert timeline == [None] * 5 + [1, 1, None, None, 2], name
+
+
+def test_preempted_process_resumes_in_new_segment():
+    workload = [(1, 0, 4, 0), (2, 1, 1, 0)]
+    processes, gantt_data, _ = sjf_scheduling(build_processes(workload), preemptive=True)
+    check_schedule(workload, processes, gantt_data)
+    assert gantt_data == [(1, 0, 1), (2, 1, 2), (1, 2, 5)]
+    assert {p.pid: p.start_time for p in processes} == {1: 0, 2: 1}
+
+
+def test_round_robin_quantum_expiry_does_not_idle():
+    workload = [(1, 0, 3, 0), (2, 0, 2, 0)]
+    processes, gantt_data, _ = round_robin_scheduling(build_processes(workload), 1)
+    check_schedule(workload, processes, gantt_data)
+    assert gantt_data == [(1, 0, 1), (2, 1, 2), (1, 2, 3), (2, 3, 4), (1, 4, 5)]
+
+
+# --- Timed mode --------------------------------------------------------------
+
+def _best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.skipif(not TIMED, reason="set SCHED_TIMED=1 to run timed checks")
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+def test_timed_against_reference(name):
+    engine, reference = ALGORITHMS[name]
+    rng = random.Random(FUZZ_SEED)
+    workload = [(pid, rng.randint(0, 600), rng.randint(1, 10), rng.randint(0, 9))
+                for pid in range(1, 121)]
+
+    engine_time = _best_of(lambda: engine(build_processes(workload)))
+    reference_time = _best_of(lambda: reference(workload))
+    ratio = engine_time / reference_time
+    print(f"{name}: engine {engine_time:.4f}s, reference {reference_time:.4f}s, ratio {ratio:.2f}")
+    assert ratio <= TIMED_FACTOR, (
+        f"{name} took {engine_time:.4f}s, {ratio:.1f}x the reference ({reference_time:.4f}s)"
+    )